@@ -1,10 +1,39 @@
+import atexit
 import logging
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from dataclasses import dataclass
 
+from core.workstealing import run_work_stealing
+
+# Process pool shared across execute() calls, so repeated process-mode
+# runs reuse spawned workers instead of paying startup per call
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_PROCESS_POOL_SIZE = 0
+
+
+def _get_process_pool(num_workers: int) -> ProcessPoolExecutor:
+    """Get the shared process pool, recreating it only when the size changes."""
+    global _PROCESS_POOL, _PROCESS_POOL_SIZE
+    if _PROCESS_POOL is None or _PROCESS_POOL_SIZE != num_workers:
+        if _PROCESS_POOL is not None:
+            _PROCESS_POOL.shutdown(wait=True)
+        _PROCESS_POOL = ProcessPoolExecutor(max_workers=num_workers)
+        _PROCESS_POOL_SIZE = num_workers
+    return _PROCESS_POOL
+
+
+def _shutdown_pools() -> None:
+    global _PROCESS_POOL
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL.shutdown(wait=True)
+        _PROCESS_POOL = None
+
+
+atexit.register(_shutdown_pools)
+
 
 @dataclass
 class JobResult:
@@ -16,7 +45,17 @@ class JobResult:
 
 
 class BaseJob(ABC):
-    """Abstract base class for all jobs."""
+    """Abstract base class for all jobs.
+
+    Concrete subclasses register themselves by declaring a feature name:
+    class MyJob(BaseJob, feature_name='myjob').
+    """
+
+    def __init_subclass__(cls, /, feature_name: Optional[str] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if feature_name:
+            from core.registry import get_registry
+            get_registry().register(feature_name, cls)
 
     def __init__(self, name: str):
         self.name = name
@@ -27,6 +66,14 @@ class BaseJob(ABC):
         """Process a single chunk of data."""
         pass
 
+    def process_chunks(self, chunks: List[Any]) -> List[JobResult]:
+        """Process a batch of chunks in one worker task.
+
+        Jobs with expensive per-task setup (JIT warm-up, cache opens)
+        can override this to amortize it across the batch.
+        """
+        return [self.process_chunk(chunk) for chunk in chunks]
+
     @abstractmethod
     def split_workload(self, path: str, num_workers: int) -> List[Any]:
         """Split the workload into chunks for parallel processing."""
@@ -56,38 +103,36 @@ class BaseJob(ABC):
         results = []
 
         if mode == 'threading':
-            with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                future_to_chunk = {
-                    executor.submit(self.process_chunk, chunk): chunk
-                    for chunk in chunks
-                }
-
-                for future in as_completed(future_to_chunk):
-                    chunk = future_to_chunk[future]
-                    try:
-                        result = future.result()
-                        results.append(result)
-                        self.logger.debug(f"Processed chunk: {chunk}")
-                    except Exception as e:
-                        self.logger.error(f"Error processing chunk {chunk}: {e}")
-                        results.append(JobResult(success=False, data=None, error=str(e)))
+            # Work-stealing threads: idle workers pull straight from busy
+            # workers' deques instead of polling a central futures queue
+            for chunk, result, error in run_work_stealing(self.process_chunk,
+                                                          chunks, num_workers):
+                if error is not None:
+                    self.logger.error(f"Error processing chunk {chunk}: {error}")
+                    results.append(JobResult(success=False, data=None, error=str(error)))
+                else:
+                    results.append(result)
+                    self.logger.debug(f"Processed chunk: {chunk}")
 
         elif mode == 'process':
-            with ProcessPoolExecutor(max_workers=num_workers) as executor:
-                future_to_chunk = {
-                    executor.submit(self.process_chunk, chunk): chunk
-                    for chunk in chunks
-                }
-
-                for future in as_completed(future_to_chunk):
-                    chunk = future_to_chunk[future]
-                    try:
-                        result = future.result()
-                        results.append(result)
-                        self.logger.debug(f"Processed chunk: {chunk}")
-                    except Exception as e:
-                        self.logger.error(f"Error processing chunk {chunk}: {e}")
-                        results.append(JobResult(success=False, data=None, error=str(e)))
+            executor = _get_process_pool(num_workers)
+
+            # One task per worker, each carrying a batch of chunks:
+            # amortizes submit bookkeeping and pickling over the batch
+            # instead of paying a round-trip per chunk
+            batches = [chunks[i::num_workers] for i in range(num_workers)]
+            futures = [(batch, executor.submit(self.process_chunks, batch))
+                       for batch in batches if batch]
+
+            # Drain in submission order: results come back deterministic
+            # and there is no future-to-batch dict to build and hash
+            for batch, future in futures:
+                try:
+                    results.extend(future.result())
+                    self.logger.debug(f"Processed batch of {len(batch)} chunks")
+                except Exception as e:
+                    self.logger.error(f"Error processing batch: {e}")
+                    results.append(JobResult(success=False, data=None, error=str(e)))
 
         return results
 
@@ -104,6 +149,18 @@ class BaseWorker(ABC):
         """Perform the actual work on a task."""
         pass
 
+    def _safe_call(self, task: Any) -> Any:
+        """Run work(task), converting per-task errors to None.
+
+        Used with executor.map, where a raising task would otherwise
+        abort iteration over the remaining results.
+        """
+        try:
+            return self.work(task)
+        except Exception as e:
+            self.logger.error("Task failed: %r, Error: %s", task, e)
+            return None
+
     def __call__(self, task: Any) -> Any:
         """Make the worker callable."""
         return self.work(task)
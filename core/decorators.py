@@ -1,20 +1,7 @@
 import functools
 import logging
 import time
-from typing import Any, Callable, Type
-from core.base import BaseJob
-
-
-def register_feature(name: str):
-    """Decorator to register a feature class with the registry."""
-
-    def decorator(feature_class: Type[BaseJob]):
-        from core.registry import get_registry
-        registry = get_registry()
-        registry.register(name, feature_class)
-        return feature_class
-
-    return decorator
+from typing import Any, Callable
 
 
 def timing_decorator(func: Callable) -> Callable:
@@ -22,12 +9,14 @@ def timing_decorator(func: Callable) -> Callable:
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs) -> Any:
-        start_time = time.time()
+        # Monotonic ns clock: immune to NTP steps, full resolution
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        elapsed_s = (time.perf_counter_ns() - start_time) / 1e9
 
         logger = logging.getLogger(func.__module__)
-        logger.info(f"{func.__name__} executed in {end_time - start_time:.4f} seconds")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"{func.__name__} executed in {elapsed_s:.4f} seconds")
 
         return result
 
@@ -39,13 +39,3 @@ _registry = FeatureRegistry()
 def get_registry() -> FeatureRegistry:
     """Get the global feature registry instance."""
     return _registry
-
-
-def register_feature(name: str):
-    """Decorator to register a feature class."""
-
-    def decorator(feature_class: Type[BaseJob]):
-        _registry.register(name, feature_class)
-        return feature_class
-
-    return decorator
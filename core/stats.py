@@ -0,0 +1,88 @@
+import math
+from typing import Dict
+
+import numpy as np
+
+try:
+    from tdigest import TDigest
+except ImportError:
+    TDigest = None
+
+
+class OnlineStats:
+    """One-pass Welford accumulator for mean/std/min/max in O(1) memory.
+
+    Workers accumulate locally and ship only (count, mean, M2, min, max);
+    partials combine exactly with Chan's parallel formula via merge().
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Fold a single sample into the accumulator."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def add_array(self, values: np.ndarray) -> None:
+        """Fold an array of samples in via vectorized reductions."""
+        if values.size == 0:
+            return
+
+        partial = OnlineStats()
+        partial.count = int(values.size)
+        partial.mean = float(values.mean())
+        partial.m2 = float(values.var()) * partial.count
+        partial.min = float(values.min())
+        partial.max = float(values.max())
+        self.merge(partial)
+
+    def merge(self, other: 'OnlineStats') -> 'OnlineStats':
+        """Combine another accumulator into this one (Chan's formula)."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count = other.count
+            self.mean = other.mean
+            self.m2 = other.m2
+            self.min = other.min
+            self.max = other.max
+            return self
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation of everything folded in so far."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    def summary(self) -> Dict[str, float]:
+        """Summary dict in the calculate_statistics shape (median excluded)."""
+        if self.count == 0:
+            return {}
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.min,
+            'max': self.max,
+            'std_dev': self.std_dev
+        }
@@ -0,0 +1,98 @@
+import array
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class WorkStealingDeque:
+    """Chase-Lev-style deque of task indices for one worker thread.
+
+    The owner pushes and pops LIFO at the top; other workers steal FIFO
+    from the bottom. CPython has no CAS primitive, so the steal lock also
+    covers the owner's pop; it is uncontended unless a thief is actively
+    stealing from this worker, which only happens when the thief's own
+    deque has drained.
+    """
+
+    def __init__(self, capacity: int):
+        self._items = array.array('q', bytes(8 * capacity))
+        self._top = 0      # owner end (exclusive)
+        self._bottom = 0   # steal end (inclusive)
+        self._lock = threading.Lock()
+
+    def push(self, index: int) -> None:
+        """Append a task index at the owner end."""
+        self._items[self._top] = index
+        self._top += 1
+
+    def pop(self) -> Optional[int]:
+        """LIFO pop by the owning worker."""
+        with self._lock:
+            if self._top > self._bottom:
+                self._top -= 1
+                return self._items[self._top]
+        return None
+
+    def steal(self) -> Optional[int]:
+        """FIFO steal by another worker."""
+        with self._lock:
+            if self._top > self._bottom:
+                index = self._items[self._bottom]
+                self._bottom += 1
+                return index
+        return None
+
+
+def _steal_any(deques: List[WorkStealingDeque], worker_id: int) -> Optional[int]:
+    """Try to steal a task index from any other worker's deque."""
+    for k in range(1, len(deques)):
+        index = deques[(worker_id + k) % len(deques)].steal()
+        if index is not None:
+            return index
+    return None
+
+
+def run_work_stealing(fn: Callable[[Any], Any], tasks: List[Any],
+                      num_workers: int) -> List[Tuple[Any, Any, Optional[Exception]]]:
+    """Run fn over tasks on num_workers threads with per-worker deques.
+
+    Tasks are seeded round-robin; a worker pops LIFO from its own deque
+    and steals FIFO from others once it drains, so no thread idles while
+    work remains. Returns (task, result, error) triples in completion
+    order, with error set when fn raised.
+    """
+    if not tasks:
+        return []
+
+    num_workers = min(num_workers, len(tasks))
+    deques = [WorkStealingDeque(len(tasks)) for _ in range(num_workers)]
+    for i in range(len(tasks)):
+        deques[i % num_workers].push(i)
+
+    results: List[Tuple[Any, Any, Optional[Exception]]] = []
+
+    def worker(worker_id: int) -> None:
+        own = deques[worker_id]
+        while True:
+            index = own.pop()
+            if index is None:
+                index = _steal_any(deques, worker_id)
+            if index is None:
+                return
+
+            task = tasks[index]
+            try:
+                # list.append is atomic under the GIL
+                results.append((task, fn(task), None))
+            except Exception as e:
+                results.append((task, None, e))
+
+    threads = [
+        threading.Thread(target=worker, args=(worker_id,), daemon=True)
+        for worker_id in range(num_workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
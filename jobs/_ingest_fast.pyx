@@ -0,0 +1,220 @@
+# cython: language_level=3
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""Fused C scanning loop for the log ingest hot path.
+
+Compile in place with `python setup.py build_ext --inplace`; jobs.ingest
+falls back to the RE2/pandas path when the extension is missing.
+
+The scan runs with the GIL released, so ingest workers in threading mode
+parse in parallel across cores; only a short per-block epilogue takes the
+GIL to fold counts into the Python dicts.
+"""
+from libc.string cimport memchr, memcmp
+
+# Status classes are a tiny fixed set, so the keys are prebuilt
+_CLS_KEYS = tuple(('%dxx' % d).encode('ascii') for d in range(10))
+
+cdef const char* _STATUS_EQ = b" status="
+cdef const char* _TIME_EQ = b" time="
+cdef const char* _MS = b"ms"
+cdef const char* _UA_EQ = b" user-agent="
+
+# Lines parsed per nogil block before counts are folded under the GIL
+DEF BLOCK = 4096
+# Capacity of the C-level dedupe table for method names
+DEF MTAB = 64
+
+
+cdef struct MethodEntry:
+    Py_ssize_t offset
+    Py_ssize_t length
+    Py_ssize_t count
+
+
+def parse_buffer(const unsigned char[::1] buf,
+                 dict by_method, dict by_status_class, dict user_agents,
+                 double[::1] latencies_out):
+    """Parse a newline-terminated log buffer in one pass.
+
+    Counts accumulate into the byte-keyed dicts and parsed latencies fill
+    latencies_out, which must hold at least one slot per line. Returns the
+    number of successfully parsed lines.
+    """
+    cdef Py_ssize_t n = buf.shape[0]
+    if n == 0:
+        return 0
+
+    cdef const unsigned char* p = &buf[0]
+    cdef const char* cp = <const char*> p
+    cdef const unsigned char* nl
+    cdef Py_ssize_t i = 0, parsed = 0
+    cdef Py_ssize_t line_end, j, k, q, b
+    cdef Py_ssize_t method_start, method_end, ua_start
+    cdef Py_ssize_t block_count
+    cdef long status, cls
+    cdef double value, scale
+    cdef bint ok
+    cdef bytes key
+
+    # Per-block scratch: line-level offsets deferred to the GIL epilogue
+    cdef Py_ssize_t m_off[BLOCK]
+    cdef Py_ssize_t m_len[BLOCK]
+    cdef Py_ssize_t u_off[BLOCK]
+    cdef Py_ssize_t u_len[BLOCK]
+
+    # Buffer-wide accumulators maintained entirely in C
+    cdef Py_ssize_t cls_counts[10]
+    cdef MethodEntry mtab[MTAB]
+    cdef int mtab_n = 0, t
+    for t in range(10):
+        cls_counts[t] = 0
+
+    while i < n:
+        block_count = 0
+
+        with nogil:
+            while i < n and block_count < BLOCK:
+                nl = <const unsigned char*> memchr(p + i, 0x0A, n - i)
+                line_end = (nl - p) if nl != NULL else n
+
+                j = i
+                i = line_end + 1  # next iteration starts after the newline
+                # Trim a trailing '\r' so CRLF logs parse like the
+                # regex fallback's \r?$ and UA keys stay clean
+                if line_end > j and p[line_end - 1] == 0x0D:
+                    line_end -= 1
+                ok = False
+
+                # "[METHOD]"
+                if j < line_end and p[j] == 0x5B:  # '['
+                    method_start = j + 1
+                    k = method_start
+                    while k < line_end and 0x41 <= p[k] <= 0x5A:  # 'A'..'Z'
+                        k += 1
+                    if k > method_start and k < line_end and p[k] == 0x5D:  # ']'
+                        method_end = k
+                        ok = True
+
+                if not ok:
+                    continue
+                ok = False
+
+                # " /path," — the path is the non-space run after the
+                # method, so the delimiter comma is the one just before
+                # the first space, exactly what the fallback's
+                # "\S+, status=" matches (embedded commas stay in the path)
+                j = method_end + 1
+                if j < line_end and p[j] == 0x20:  # ' '
+                    nl = <const unsigned char*> memchr(p + j + 1, 0x20,
+                                                       line_end - j - 1)  # ' '
+                    if nl != NULL:
+                        q = (nl - p) - 1
+                        if q > j + 1 and p[q] == 0x2C:  # ','
+                            ok = True
+                if not ok:
+                    continue
+                ok = False
+
+                # ", status=NNN"
+                if q + 9 < line_end and memcmp(cp + q + 1, _STATUS_EQ, 8) == 0:
+                    q += 9
+                    status = 0
+                    j = q
+                    while q < line_end and 0x30 <= p[q] <= 0x39:  # '0'..'9'
+                        status = status * 10 + (p[q] - 0x30)
+                        q += 1
+                    ok = q > j
+                if not ok:
+                    continue
+                ok = False
+
+                # ", time=F.Fms"
+                if (q + 7 < line_end and p[q] == 0x2C
+                        and memcmp(cp + q + 1, _TIME_EQ, 6) == 0):
+                    q += 7
+                    value = 0.0
+                    j = q
+                    while q < line_end and 0x30 <= p[q] <= 0x39:
+                        value = value * 10.0 + (p[q] - 0x30)
+                        q += 1
+                    if q > j:
+                        ok = True
+                        if q < line_end and p[q] == 0x2E:  # '.'
+                            q += 1
+                            scale = 0.1
+                            k = q
+                            while q < line_end and 0x30 <= p[q] <= 0x39:
+                                value += (p[q] - 0x30) * scale
+                                scale *= 0.1
+                                q += 1
+                            if q == k:
+                                # a bare '.' is not part of the fallback's
+                                # \d+(?:\.\d+)? time grammar
+                                ok = False
+                        if ok and not (q + 2 <= line_end
+                                       and memcmp(cp + q, _MS, 2) == 0):
+                            ok = False
+                        if ok:
+                            q += 2
+                if not ok:
+                    continue
+
+                # optional " user-agent=UA" running to end of line
+                ua_start = -1
+                if q < line_end:
+                    if q + 12 > line_end or memcmp(cp + q, _UA_EQ, 12) != 0:
+                        continue
+                    ua_start = q + 12
+
+                # Dedupe the method in the C table; overflow entries are
+                # deferred to the epilogue via the per-line scratch
+                m_off[block_count] = -1
+                for t in range(mtab_n):
+                    if (mtab[t].length == method_end - method_start
+                            and memcmp(cp + mtab[t].offset, cp + method_start,
+                                       mtab[t].length) == 0):
+                        mtab[t].count += 1
+                        break
+                else:
+                    if mtab_n < MTAB:
+                        mtab[mtab_n].offset = method_start
+                        mtab[mtab_n].length = method_end - method_start
+                        mtab[mtab_n].count = 1
+                        mtab_n += 1
+                    else:
+                        m_off[block_count] = method_start
+                        m_len[block_count] = method_end - method_start
+
+                cls = status / 100
+                if 0 <= cls <= 9:
+                    cls_counts[cls] += 1
+
+                if ua_start >= 0 and ua_start < line_end:
+                    u_off[block_count] = ua_start
+                    u_len[block_count] = line_end - ua_start
+                else:
+                    u_off[block_count] = -1
+
+                latencies_out[parsed] = value
+                parsed += 1
+                block_count += 1
+
+        # GIL-holding epilogue: fold this block's deferred keys into the dicts
+        for b in range(block_count):
+            if m_off[b] >= 0:
+                key = cp[m_off[b]:m_off[b] + m_len[b]]
+                by_method[key] = by_method.get(key, 0) + 1
+            if u_off[b] >= 0:
+                key = cp[u_off[b]:u_off[b] + u_len[b]]
+                user_agents[key] = user_agents.get(key, 0) + 1
+
+    # Flush the C-level accumulators
+    for t in range(mtab_n):
+        key = cp[mtab[t].offset:mtab[t].offset + mtab[t].length]
+        by_method[key] = by_method.get(key, 0) + mtab[t].count
+    for t in range(10):
+        if cls_counts[t]:
+            key = <bytes> _CLS_KEYS[t]
+            by_status_class[key] = by_status_class.get(key, 0) + cls_counts[t]
+
+    return parsed
@@ -0,0 +1,46 @@
+"""Numba-compiled segmented sieve kernel for the prime job.
+
+Importing this module requires numba; jobs.prime falls back to the
+pure-NumPy segmented sieve when it is unavailable.
+"""
+import numpy as np
+from numba import config, njit, prange
+
+# The workqueue and tbb threading layers hang at interpreter shutdown
+# when a parallel kernel has been entered from a non-main thread, which
+# is exactly how the work-stealing threading mode calls it. Pin the
+# OpenMP layer; jobs.prime falls back to the NumPy sieve if the kernel
+# fails at call time (e.g. OpenMP missing on this machine).
+config.THREADING_LAYER = 'omp'
+
+# Segment block size chosen so each block's boolean slice fits in L1
+_SEGMENT_SIZE = 64 * 1024
+
+
+@njit(parallel=True, cache=True)
+def sieve_range(start: int, end: int, base_primes: np.ndarray) -> np.ndarray:
+    """Find primes in [start, end] with a segmented sieve, parallel over blocks.
+
+    start must be >= 2 and base_primes must cover sqrt(end).
+    """
+    n = end - start + 1
+    sieve = np.ones(n, dtype=np.bool_)
+    num_blocks = (n + _SEGMENT_SIZE - 1) // _SEGMENT_SIZE
+
+    for b in prange(num_blocks):
+        lo = start + b * _SEGMENT_SIZE
+        hi = lo + _SEGMENT_SIZE
+        if hi > end + 1:
+            hi = end + 1
+
+        for k in range(base_primes.shape[0]):
+            p = base_primes[k]
+            if p * p >= hi:
+                break
+            first = p * p
+            if first < lo:
+                first = ((lo + p - 1) // p) * p
+            for m in range(first, hi, p):
+                sieve[m - start] = False
+
+    return np.nonzero(sieve)[0] + start
@@ -1,88 +1,247 @@
 import logging
+import mmap
+import re
 from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import re2 as _re  # google-re2: linear-time DFA, no backtracking
+except ImportError:
+    _re = re
+
+try:
+    from jobs import _ingest_fast  # compiled via setup.py build_ext --inplace
+except ImportError:
+    _ingest_fast = None
+
+try:
+    from joblib import Memory
+    _mem = Memory('.cache/ingest', verbose=0)
+except ImportError:
+    _mem = None
 
 from core.base import BaseJob, JobResult
-from core.decorators import register_feature, timing_decorator
-from core.utils import (
-    parse_log_line,
-    get_status_class,
-    calculate_statistics,
-    format_output
+from core.stats import OnlineStats, TDigest
+from core.utils import format_output
+
+# A unit of ingest work: (file, start byte, end byte)
+FileSlice = Tuple[Path, int, int]
+
+# Log format: [METHOD] /path, status=XXX, time=XXXms user-agent=XXX
+# Multiline so one findall call scans a whole buffer of lines at once;
+# a bytes pattern keeps the match entirely off the UTF-8 codec
+_LINE_RE = _re.compile(
+    rb'(?m)^\[(?P<method>[A-Z]+)\] (?P<path>\S+), '
+    rb'status=(?P<status>\d+), time=(?P<time_ms>\d+(?:\.\d+)?)ms'
+    rb'(?: user-agent=(?P<user_agent>.*?))?\r?$'
 )
 
 
-@register_feature('ingest')
-class LogIngestJob(BaseJob):
+def _slice_bytes(file_path: Path, start: int, end: int) -> bytes:
+    """Read the log lines owned by the byte slice [start, end) of a file.
+
+    A slice owns every line whose first byte falls inside it, so lines
+    straddling a slice boundary are read exactly once across workers.
+    """
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if start == 0:
+                begin = 0
+            else:
+                nl = mm.find(b'\n', start - 1)
+                begin = len(mm) if nl == -1 else nl + 1
+
+            if end >= len(mm):
+                stop = len(mm)
+            else:
+                nl = mm.find(b'\n', end - 1)
+                stop = len(mm) if nl == -1 else nl + 1
+
+            if begin >= stop:
+                return b''
+
+            return mm[begin:stop]
+
+
+def _parse_slice(path_str: str, start: int, end: int,
+                 mtime: float, size: int) -> Dict[str, Any]:
+    """Parse one byte slice of a log file into aggregate counts.
+
+    mtime and size take part in the disk-cache key, so unchanged files
+    hit the cache across runs while edits invalidate it.
+    """
+    empty: Dict[str, Any] = {
+        'total_requests': 0,
+        'by_method': {},
+        'by_status_class': {},
+        'user_agents': {},
+        'latencies': np.empty(0, dtype=np.float32),
+    }
+
+    if _ingest_fast is not None:
+        # Single fused C pass: scan, parse and count in one go
+        raw = _slice_bytes(Path(path_str), start, end)
+        if not raw:
+            return empty
+        if not raw.endswith(b'\n'):
+            raw += b'\n'
+
+        b_method: Dict[bytes, int] = {}
+        b_status: Dict[bytes, int] = {}
+        b_ua: Dict[bytes, int] = {}
+        out = np.empty(raw.count(b'\n'), dtype=np.float64)
+        count = _ingest_fast.parse_buffer(raw, b_method, b_status, b_ua, out)
+
+        return {
+            'total_requests': count,
+            'by_method': {k.decode('utf-8', 'replace'): v for k, v in b_method.items()},
+            'by_status_class': {k.decode('ascii'): v for k, v in b_status.items()},
+            'user_agents': {k.decode('utf-8', 'replace'): v for k, v in b_ua.items()},
+            'latencies': out[:count].astype(np.float32),
+        }
+
+    raw = _slice_bytes(Path(path_str), start, end)
+    if not raw:
+        return empty
+
+    # One DFA scan over the whole slice pulls out every well-formed line
+    # in a single C-level pass, without ever decoding the buffer
+    rows = _LINE_RE.findall(raw)
+    if not rows:
+        return empty
+
+    # Columns: method, path, status, time_ms, user_agent (as bytes);
+    # NumPy parses numeric byte strings directly, skipping the codec
+    arr = np.array(rows, dtype=np.bytes_)
+    classes, cls_counts = np.unique(arr[:, 2].astype(np.int64) // 100,
+                                    return_counts=True)
+    methods, method_counts = np.unique(arr[:, 0], return_counts=True)
+    # findall yields b'' for lines without a user agent
+    ua = arr[:, 4]
+    ua_values, ua_counts = np.unique(ua[ua != b''], return_counts=True)
+
+    return {
+        'total_requests': len(rows),
+        'by_method': {m.decode('utf-8', 'replace'): int(c)
+                      for m, c in zip(methods, method_counts)},
+        'by_status_class': {'%dxx' % d: int(c)
+                            for d, c in zip(classes, cls_counts)},
+        'user_agents': {u.decode('utf-8', 'replace'): int(c)
+                        for u, c in zip(ua_values, ua_counts)},
+        # float32 halves the bytes shipped between workers
+        'latencies': arr[:, 3].astype(np.float32),
+    }
+
+
+if _mem is not None:
+    _parse_slice = _mem.cache(_parse_slice)
+
+
+def _sum_counts(series_list: List[pd.Series]) -> pd.Series:
+    """Sum per-worker count mappings into one Series, sorted descending."""
+    if not series_list:
+        return pd.Series(dtype='int64')
+    return pd.concat(series_list).groupby(level=0).sum().sort_values(ascending=False)
+
+
+class LogIngestJob(BaseJob, feature_name='ingest'):
     """Job for ingesting and parsing log files."""
 
     def __init__(self):
         super().__init__("Log Ingest & Parser")
 
-    def split_workload(self, path: str, num_workers: int) -> List[Path]:
-        """Split log files among workers."""
+    def split_workload(self, path: str, num_workers: int) -> List[List[FileSlice]]:
+        """Split log files into equal byte ranges among workers.
+
+        Splitting by bytes rather than whole files keeps workers balanced
+        even when one log file dwarfs the others.
+        """
         log_dir = Path(path)
-        log_files = list(log_dir.glob("*.log"))
+        log_files = [(p, p.stat().st_size) for p in sorted(log_dir.glob("*.log"))]
+        log_files = [(p, size) for p, size in log_files if size > 0]
 
         if not log_files:
             self.logger.warning(f"No .log files found in {path}")
             return []
 
-        # Simple round-robin distribution
-        chunks = [[] for _ in range(num_workers)]
-        for i, file_path in enumerate(log_files):
-            chunks[i % num_workers].append(file_path)
+        total_bytes = sum(size for _, size in log_files)
+        target = max(1, total_bytes // num_workers)
+
+        chunks: List[List[FileSlice]] = [[] for _ in range(num_workers)]
+        worker = 0
+        filled = 0
+
+        for file_path, size in log_files:
+            offset = 0
+            while offset < size:
+                if filled >= target and worker < num_workers - 1:
+                    worker += 1
+                    filled = 0
+
+                if worker < num_workers - 1:
+                    take = min(size - offset, target - filled)
+                else:
+                    take = size - offset
+
+                chunks[worker].append((file_path, offset, offset + take))
+                offset += take
+                filled += take
 
         # Filter out empty chunks
         return [chunk for chunk in chunks if chunk]
 
-    def process_chunk(self, chunk: List[Path]) -> JobResult:
-        """Process a chunk of log files."""
+    def process_chunk(self, chunk: List[FileSlice]) -> JobResult:
+        """Process a chunk of log file slices."""
         try:
             total_requests = 0
             by_method = Counter()
             by_status_class = Counter()
-            latencies = []
             user_agents = Counter()
 
-            for file_path in chunk:
-                self.logger.debug(f"Processing file: {file_path}")
+            # O(1)-size latency accumulators instead of the raw array:
+            # Welford for the moments, a t-digest for the median
+            latency_stats = OnlineStats()
+            latency_digest = TDigest() if TDigest is not None else None
+
+            for file_path, start, end in chunk:
+                self.logger.debug(f"Processing slice: {file_path} [{start}:{end}]")
 
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        for line_num, line in enumerate(f, 1):
-                            parsed = parse_log_line(line)
-                            if parsed:
-                                total_requests += 1
-                                by_method[parsed['method']] += 1
-                                by_status_class[get_status_class(parsed['status'])] += 1
-                                latencies.append(parsed['time_ms'])
-
-                                if parsed['user_agent']:
-                                    user_agents[parsed['user_agent']] += 1
-                            else:
-                                self.logger.debug(f"Failed to parse line {line_num} in {file_path}")
+                    stat = file_path.stat()
+                    parsed = _parse_slice(str(file_path), start, end,
+                                          stat.st_mtime, stat.st_size)
+
+                    total_requests += parsed['total_requests']
+                    by_method.update(parsed['by_method'])
+                    by_status_class.update(parsed['by_status_class'])
+                    user_agents.update(parsed['user_agents'])
+
+                    if parsed['latencies'].size:
+                        latency_stats.add_array(parsed['latencies'])
+                        if latency_digest is not None:
+                            latency_digest.batch_update(parsed['latencies'])
 
                 except Exception as e:
-                    self.logger.error(f"Error reading file {file_path}: {e}")
+                    self.logger.error(f"Error reading slice of {file_path}: {e}")
                     continue
 
-            # Calculate latency statistics
-            latency_stats = calculate_statistics(latencies) if latencies else {}
-
             result_data = {
                 'total_requests': total_requests,
                 'by_method': by_method,
                 'by_status_class': by_status_class,
                 'latency_stats': latency_stats,
+                'latency_digest': latency_digest,
                 'user_agents': user_agents
             }
 
             return JobResult(
                 success=True,
                 data=result_data,
-                metadata={'files_processed': len(chunk)}
+                metadata={'slices_processed': len(chunk)}
             )
 
         except Exception as e:
@@ -93,37 +252,40 @@ class LogIngestJob(BaseJob):
         """Merge results from all workers."""
         # Initialize aggregated counters
         total_requests = 0
-        by_method = Counter()
-        by_status_class = Counter()
-        all_latencies = []
-        user_agents = Counter()
-        files_processed = 0
+        method_series = []
+        status_series = []
+        ua_series = []
+        latency_stats = OnlineStats()
+        latency_digest = TDigest() if TDigest is not None else None
+        slices_processed = 0
 
         # Aggregate results
         for result in results:
             if result.success and result.data:
                 total_requests += result.data['total_requests']
-                by_method.update(result.data['by_method'])
-                by_status_class.update(result.data['by_status_class'])
+                method_series.append(pd.Series(result.data['by_method']))
+                status_series.append(pd.Series(result.data['by_status_class']))
+                ua_series.append(pd.Series(result.data['user_agents']))
 
-                # Collect latencies for overall statistics
-                if 'latency_stats' in result.data and result.data['latency_stats']:
-                    # We need to reconstruct the latency list from stats
-                    # This is a limitation - in a real system, we'd pass the raw data
-                    count = result.data['latency_stats'].get('count', 0)
-                    mean = result.data['latency_stats'].get('mean', 0)
-                    # For simplicity, we'll use the mean for each request
-                    all_latencies.extend([mean] * int(count))
-
-                user_agents.update(result.data['user_agents'])
+                latency_stats.merge(result.data['latency_stats'])
+                if latency_digest is not None and result.data['latency_digest'] is not None:
+                    latency_digest = latency_digest + result.data['latency_digest']
 
                 if result.metadata:
-                    files_processed += result.metadata.get('files_processed', 0)
+                    slices_processed += result.metadata.get('slices_processed', 0)
             else:
                 self.logger.warning(f"Worker result failed: {result.error}")
 
-        # Calculate overall latency statistics
-        overall_latency_stats = calculate_statistics(all_latencies) if all_latencies else {}
+        # Combine the streamed accumulators into the display stats
+        overall_latency_stats = latency_stats.summary()
+        if overall_latency_stats and latency_digest is not None:
+            overall_latency_stats['median'] = latency_digest.percentile(50)
+
+        # Sum the per-worker counts in pandas' C-level hash groupby rather
+        # than looping Counter.update over every distinct key
+        by_method = _sum_counts(method_series)
+        by_status_class = _sum_counts(status_series)
+        user_agents = _sum_counts(ua_series)
 
         # Prepare final output
         final_data = {
@@ -134,6 +296,6 @@ class LogIngestJob(BaseJob):
             'user_agents': user_agents
         }
 
-        self.logger.info(f"Processed {files_processed} files with {total_requests} total requests")
+        self.logger.info(f"Processed {slices_processed} file slices with {total_requests} total requests")
 
         return format_output(final_data)
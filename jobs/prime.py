@@ -1,18 +1,60 @@
+import heapq
+import itertools
 import logging
 import math
+import threading
 from typing import List, Tuple, Dict, Any
 
+import numpy as np
+
 from core.base import BaseJob, JobResult
-from core.decorators import register_feature, timing_decorator
 from core.utils import load_json_file
 
+try:
+    from jobs import _prime_kernel
+except ImportError:  # numba not installed
+    _prime_kernel = None
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+# Above this bound, testing each candidate with GMP's Miller-Rabin beats
+# sieving base primes up to sqrt(end) and a segment of the full range
+_GMP_THRESHOLD = 10 ** 12
+
+# Guards growth of the cached base primes: work-stealing threads call
+# process_chunk concurrently on one job instance, and an unsynchronized
+# check-then-write can publish a _base_limit the cached array does not
+# cover (module-level so the job instance stays picklable for process
+# mode)
+_BASE_LOCK = threading.Lock()
+
 
-@register_feature('prime')
-class PrimeCalculationJob(BaseJob):
+def _simple_sieve(limit: int) -> np.ndarray:
+    """Sieve of Eratosthenes up to limit, returning the primes as int64."""
+    if limit < 2:
+        return np.empty(0, dtype=np.int64)
+
+    mask = np.ones(limit + 1, dtype=np.bool_)
+    mask[:2] = False
+    for i in range(2, math.isqrt(limit) + 1):
+        if mask[i]:
+            mask[i * i::i] = False
+
+    return np.nonzero(mask)[0].astype(np.int64)
+
+
+class PrimeCalculationJob(BaseJob, feature_name='prime'):
     """Job for CPU-intensive prime number calculations."""
 
     def __init__(self):
         super().__init__("Prime Number Calculator")
+        # Base primes for the segmented sieve, cached up to the largest
+        # range end seen so far
+        self._base_primes: np.ndarray = np.empty(0, dtype=np.int64)
+        self._base_limit = 1
 
     def split_workload(self, path: str, num_workers: int) -> List[Tuple[int, int]]:
         """Split number ranges among workers."""
@@ -25,12 +67,24 @@ class PrimeCalculationJob(BaseJob):
                 self.logger.warning("No ranges found in configuration file")
                 return []
 
-            # Distribute ranges among workers
-            chunks = [[] for _ in range(num_workers)]
-            for i, range_data in enumerate(ranges):
+            # Estimate per-range cost: range length weighted by candidate
+            # size, so high ranges don't all land on one worker
+            costed = []
+            for range_data in ranges:
                 start = range_data.get('start', 1)
                 end = range_data.get('end', 1000)
-                chunks[i % num_workers].append((start, end))
+                cost = (end - start + 1) * math.isqrt(max(end, 1))
+                costed.append((cost, (start, end)))
+
+            # Longest-processing-time-first: heaviest ranges go first,
+            # each to the currently lightest worker
+            costed.sort(reverse=True)
+            chunks = [[] for _ in range(num_workers)]
+            heap = [(0, i) for i in range(num_workers)]
+            for cost, number_range in costed:
+                total, i = heapq.heappop(heap)
+                chunks[i].append(number_range)
+                heapq.heappush(heap, (total + cost, i))
 
             # Filter out empty chunks
             return [chunk for chunk in chunks if chunk]
@@ -42,30 +96,35 @@ class PrimeCalculationJob(BaseJob):
     def process_chunk(self, chunk: List[Tuple[int, int]]) -> JobResult:
         """Process a chunk of number ranges to find primes."""
         try:
-            all_primes = []
+            prime_arrays = []
             total_numbers_checked = 0
 
             for start, end in chunk:
                 self.logger.debug(f"Processing range {start}-{end}")
 
                 # Find primes in this range
-                primes_in_range = self._find_primes_in_range(start, end)
-                all_primes.extend(primes_in_range)
+                prime_arrays.append(self._find_primes_in_range(start, end))
                 total_numbers_checked += (end - start + 1)
 
+            # Each range's sieve output is already sorted; keeping the
+            # arrays separate lets the merge step k-way merge them
+            # lazily instead of concatenating and sorting everything
+            prime_arrays = [arr for arr in prime_arrays if arr.size]
+            primes_found = sum(arr.size for arr in prime_arrays)
+
             # Calculate statistics
             stats = {
-                'primes_found': len(all_primes),
+                'primes_found': int(primes_found),
                 'total_numbers_checked': total_numbers_checked,
-                'largest_prime': max(all_primes) if all_primes else 0,
-                'smallest_prime': min(all_primes) if all_primes else 0,
-                'prime_density': len(all_primes) / total_numbers_checked if total_numbers_checked > 0 else 0
+                'largest_prime': max(int(arr[-1]) for arr in prime_arrays) if prime_arrays else 0,
+                'smallest_prime': min(int(arr[0]) for arr in prime_arrays) if prime_arrays else 0,
+                'prime_density': primes_found / total_numbers_checked if total_numbers_checked > 0 else 0
             }
 
             return JobResult(
                 success=True,
                 data={
-                    'primes': all_primes,
+                    'primes_per_range': prime_arrays,
                     'statistics': stats,
                     'ranges_processed': len(chunk)
                 },
@@ -76,60 +135,88 @@ class PrimeCalculationJob(BaseJob):
             self.logger.error(f"Error processing chunk: {e}")
             return JobResult(success=False, data=None, error=str(e))
 
-    def _find_primes_in_range(self, start: int, end: int) -> List[int]:
-        """Find all prime numbers in the given range."""
-        primes = []
+    def _get_base_primes(self, end: int) -> np.ndarray:
+        """Get base primes up to sqrt(end), reusing the cached array when possible."""
+        limit = math.isqrt(end) + 1
+        if limit > self._base_limit:
+            with _BASE_LOCK:
+                # Re-check under the lock: another thread may have grown
+                # the cache while we waited
+                if limit > self._base_limit:
+                    primes = _simple_sieve(limit)
+                    self._base_primes = primes
+                    self._base_limit = limit
+        return self._base_primes
+
+    def _find_primes_in_range(self, start: int, end: int) -> np.ndarray:
+        """Find all prime numbers in the given range using a segmented sieve."""
+        global _prime_kernel
 
         # Ensure start is at least 2
         if start < 2:
             start = 2
-
-        for num in range(start, end + 1):
-            if self._is_prime(num):
-                primes.append(num)
-
-        return primes
-
-    def _is_prime(self, n: int) -> bool:
-        """Check if a number is prime using optimized trial division."""
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-
-        # Check odd divisors up to square root
-        sqrt_n = int(math.sqrt(n)) + 1
-        for i in range(3, sqrt_n, 2):
-            if n % i == 0:
-                return False
-
-        return True
+        if end < start:
+            return np.empty(0, dtype=np.int64)
+
+        # Very large candidates: per-number primality tests in GMP
+        if gmpy2 is not None and end > _GMP_THRESHOLD:
+            primes = [2] if start <= 2 else []
+            first_odd = max(start, 3) | 1
+            primes.extend(n for n in range(first_odd, end + 1, 2)
+                          if gmpy2.is_prime(n))
+            return np.asarray(primes, dtype=np.int64)
+
+        base_primes = self._get_base_primes(end)
+
+        # Prefer the JIT-compiled kernel: parallel across L1-sized segment
+        # blocks, no interpreter dispatch in the marking loop
+        if _prime_kernel is not None:
+            try:
+                return _prime_kernel.sieve_range(start, end, base_primes)
+            except Exception as e:
+                # e.g. no threadsafe threading layer on this machine;
+                # disable the kernel and use the NumPy sieve instead
+                _prime_kernel = None
+                self.logger.warning(f"Prime kernel unavailable, using NumPy sieve: {e}")
+
+        # Mark composites in a boolean segment via vectorized strided stores
+        sieve = np.ones(end - start + 1, dtype=np.bool_)
+        for p in base_primes:
+            p = int(p)
+            if p * p > end:
+                break
+            first = max(p * p, ((start + p - 1) // p) * p)
+            sieve[first - start::p] = False
+
+        return np.nonzero(sieve)[0] + start
 
     def merge_results(self, results: List[JobResult]) -> str:
         """Merge results from all workers."""
-        all_primes = []
+        prime_arrays = []
         total_numbers_checked = 0
         total_ranges_processed = 0
 
         # Aggregate results
         for result in results:
             if result.success and result.data:
-                all_primes.extend(result.data['primes'])
+                prime_arrays.extend(result.data['primes_per_range'])
                 total_numbers_checked += result.data['statistics']['total_numbers_checked']
-                total_ranges_processed += result.data['statistics'].get('ranges_processed', 0)
+                total_ranges_processed += result.data.get('ranges_processed', 0)
             else:
                 self.logger.warning(f"Worker result failed: {result.error}")
 
+        total_primes = sum(arr.size for arr in prime_arrays)
+
         # Calculate overall statistics
-        if all_primes:
+        if total_primes:
+            # Each per-range array is sorted, so the extrema come from
+            # the first/last elements alone
             overall_stats = {
-                'total_primes_found': len(all_primes),
+                'total_primes_found': int(total_primes),
                 'total_numbers_checked': total_numbers_checked,
-                'largest_prime': max(all_primes),
-                'smallest_prime': min(all_primes),
-                'prime_density': len(all_primes) / total_numbers_checked if total_numbers_checked > 0 else 0,
+                'largest_prime': max(int(arr[-1]) for arr in prime_arrays),
+                'smallest_prime': min(int(arr[0]) for arr in prime_arrays),
+                'prime_density': total_primes / total_numbers_checked if total_numbers_checked > 0 else 0,
                 'ranges_processed': total_ranges_processed
             }
         else:
@@ -154,10 +241,12 @@ class PrimeCalculationJob(BaseJob):
         output_lines.append(f"Ranges Processed: {overall_stats['ranges_processed']}")
 
         # Show first 20 primes if any found
-        if all_primes:
+        if total_primes:
             output_lines.append("")
             output_lines.append("First 20 Primes Found:")
-            first_20 = sorted(all_primes)[:20]
+            # k-way merge of the sorted per-range arrays: O(20 log R)
+            # instead of touching every prime
+            first_20 = itertools.islice(heapq.merge(*prime_arrays), 20)
             output_lines.append(", ".join(map(str, first_20)))
 
         self.logger.info(
@@ -25,7 +25,7 @@ Examples:
 
     parser.add_argument(
         'feature',
-        choices=['ingest', 'prime'],
+        choices=get_registry().list_features(),
         help='Feature to execute (ingest: log parsing, prime: CPU-bound calculation)'
     )
 
@@ -78,7 +78,8 @@ def validate_arguments(args: argparse.Namespace) -> None:
 
     # Validate mode selection based on feature
     if args.feature == 'ingest' and args.mode == 'process':
-        print("Warning: Log ingest is I/O-bound and works better with threading mode")
+        print("Warning: Log ingest parses with the GIL released; threading mode "
+              "scales across cores without process startup and pickling overhead")
     elif args.feature == 'prime' and args.mode == 'threading':
         print("Warning: Prime calculation is CPU-bound and works better with process mode")
 
@@ -1,21 +1,73 @@
 import json
 import logging
-from pathlib import Path
+import mmap
+import os
+import uuid
+from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson  # Rust JSON codec: SIMD parsing, bytes in and out
+except ImportError:
+    orjson = None
+
+# Below this size a plain read beats mmap: page-table setup costs more
+# than copying the whole file
+_MMAP_THRESHOLD = 64 * 1024
+
+# Result payloads at least this large are written through an mmap so
+# the bytes land straight in the page cache with one flush
+_MMAP_WRITE_THRESHOLD = 1024 * 1024
+
+
+def _json_default(obj: Any) -> str:
+    """Fallback encoder for types the JSON codec lacks native support for."""
+    if isinstance(obj, (datetime, date, uuid.UUID)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_bytes(data: Any, indent: int = 2) -> bytes:
+    """Encode data to UTF-8 JSON bytes in a single pass."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option, default=_json_default)
+    return json.dumps(data, indent=indent or None, ensure_ascii=False,
+                      default=_json_default).encode('utf-8')
+
 
 class JSONSerializer:
     """JSON serialization utility class."""
 
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Resolve the codec's per-call knobs once: option bitmasks and a
+        # bound dumps reference, so hot write paths skip the module
+        # attribute lookups
+        if orjson is not None:
+            self._opt_indented = orjson.OPT_INDENT_2
+            self._opt_flat = 0
+            self._dumps = orjson.dumps
+        else:
+            self._dumps = None
+        # Directories already created this session, so repeated result
+        # writes into the same place skip the mkdir/stat syscalls
+        self._ensured_dirs: set = set()
 
     def serialize(self, data: Any, file_path: str, indent: int = 2) -> bool:
         """Serialize data to JSON file."""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, ensure_ascii=False)
-            self.logger.debug(f"Data serialized to {file_path}")
+            if self._dumps is not None:
+                # One dumps call producing UTF-8 bytes, written directly:
+                # no Python-level str build or re-encoding pass
+                option = self._opt_indented if indent else self._opt_flat
+                with open(file_path, 'wb') as f:
+                    f.write(self._dumps(data, option=option, default=_json_default))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=indent, ensure_ascii=False,
+                              default=_json_default)
+            self.logger.debug("Data serialized to %s", file_path)
             return True
         except Exception as e:
             self.logger.error(f"Error serializing data to {file_path}: {e}")
@@ -24,9 +76,24 @@ class JSONSerializer:
     def deserialize(self, file_path: str) -> Optional[Any]:
         """Deserialize data from JSON file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            self.logger.debug(f"Data deserialized from {file_path}")
+            with open(file_path, 'rb') as f:
+                # Large files: parse straight out of the page cache via
+                # mmap instead of copying everything into a bytes object
+                # first (mmap rejects empty files, so guard size 0)
+                size = os.fstat(f.fileno()).st_size
+                if size >= _MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        view = memoryview(mm)
+                        try:
+                            data = (orjson.loads(view) if orjson is not None
+                                    else json.loads(view.tobytes()))
+                        finally:
+                            # The view must be dropped before mm closes
+                            view.release()
+                else:
+                    raw = f.read()
+                    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self.logger.debug("Data deserialized from %s", file_path)
             return data
         except Exception as e:
             self.logger.error(f"Error deserializing data from {file_path}: {e}")
@@ -34,15 +101,36 @@ class JSONSerializer:
 
     def serialize_results(self, results: Dict[str, Any], output_dir: str, filename: str) -> str:
         """Serialize job results to JSON file."""
-        output_path = Path(output_dir) / f"{filename}.json"
+        # os.path.join returns the str we need directly, with no Path
+        # object built just to stringify it again
+        output_path = os.path.join(output_dir, f"{filename}.json")
 
-        # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure output directory exists (once per directory)
+        if output_dir not in self._ensured_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            self._ensured_dirs.add(output_dir)
 
-        if self.serialize(results, str(output_path)):
-            return str(output_path)
-        else:
-            raise RuntimeError(f"Failed to serialize results to {output_path}")
+        try:
+            # Encode once to bytes and write through a temp file, so the
+            # final path only ever holds a complete document
+            payload = _dump_bytes(results)
+            tmp_path = output_path + '.tmp'
+            if len(payload) >= _MMAP_WRITE_THRESHOLD:
+                # Size the file exactly, map it and copy the payload in
+                # one shot, flushed with a single msync
+                with open(tmp_path, 'w+b') as f:
+                    f.truncate(len(payload))
+                    with mmap.mmap(f.fileno(), len(payload)) as mm:
+                        mm.write(payload)
+                        mm.flush()
+            else:
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+            os.replace(tmp_path, output_path)
+            self.logger.debug("Results serialized to %s", output_path)
+            return output_path
+        except Exception as e:
+            raise RuntimeError(f"Failed to serialize results to {output_path}: {e}")
 
     def load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from JSON file."""
@@ -61,16 +149,18 @@ class ResultSerializer(JSONSerializer):
 
     def serialize_job_result(self, result_data: Dict[str, Any], job_name: str, output_dir: str) -> str:
         """Serialize job result with metadata."""
+        # One timestamp per result: cheaper, and the filename is
+        # guaranteed to match the embedded metadata
+        timestamp = self._get_timestamp()
         result_with_metadata = {
             'job_name': job_name,
-            'timestamp': self._get_timestamp(),
+            'timestamp': timestamp,
             'data': result_data
         }
 
-        filename = f"{job_name}_result_{self._get_timestamp()}"
+        filename = f"{job_name}_result_{timestamp}"
         return self.serialize_results(result_with_metadata, output_dir, filename)
 
     def _get_timestamp(self) -> str:
         """Get current timestamp as string."""
-        from datetime import datetime
         return datetime.now().strftime("%Y%m%d_%H%M%S")
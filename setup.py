@@ -0,0 +1,13 @@
+"""Build script for the optional compiled extensions.
+
+Usage: python setup.py build_ext --inplace
+The orchestrator runs without the extensions; the jobs fall back to
+their pure-Python implementations when the compiled modules are missing.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='mini-orchestrator',
+    ext_modules=cythonize(['jobs/_ingest_fast.pyx'], language_level=3),
+)
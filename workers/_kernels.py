@@ -0,0 +1,44 @@
+"""Numba-compiled kernels for the CPU-intensive workers.
+
+Imported lazily by workers/process_worker.py; callers fall back to the
+NumPy/pure-Python paths when numba is not installed.
+"""
+import numpy as np
+from numba import config, njit, prange
+
+# The default workqueue layer (and tbb) can hang the interpreter at
+# shutdown when a parallel kernel was entered from a non-main thread;
+# OpenMP tears down cleanly, so pin it explicitly
+config.THREADING_LAYER = 'omp'
+
+
+@njit(cache=True)
+def is_prime(n):
+    """Trial-division primality test compiled to machine code."""
+    if n < 2:
+        return False
+    if n == 2:
+        return True
+    if n % 2 == 0:
+        return False
+
+    i = 3
+    while i * i <= n:
+        if n % i == 0:
+            return False
+        i += 2
+    return True
+
+
+@njit(parallel=True, cache=True)
+def primes_in_range(start, end):
+    """All primes in [start, end] as int64, tested in parallel."""
+    lo = max(start, 2)
+    if end < lo:
+        return np.empty(0, dtype=np.int64)
+
+    flags = np.zeros(end - lo + 1, dtype=np.bool_)
+    for i in prange(end - lo + 1):
+        flags[i] = is_prime(lo + i)
+
+    return np.nonzero(flags)[0] + lo
@@ -1,24 +1,146 @@
+import functools
 import logging
 import math
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Callable, List, Optional
 
+import numpy as np
+
 from core.base import BaseWorker
 
+try:
+    from workers import _kernels
+except ImportError:  # numba not installed
+    _kernels = None
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+
+def _worker_init() -> None:
+    """Warm up child processes once at pool startup.
+
+    Importing the heavy numeric stack here means the first real task
+    does not pay the import (and numba compile-cache load) cost.
+    """
+    import numpy  # noqa: F401
+    try:
+        from workers import _kernels  # noqa: F401
+    except ImportError:
+        pass
+
+# Module-level so they stay picklable for pool submission and so the
+# caches are shared by every worker instance in the process
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _is_prime(n: int) -> bool:
+    """Check if a number is prime using optimized trial division."""
+    if _kernels is not None:
+        return bool(_kernels.is_prime(n))
+
+    if n < 2:
+        return False
+    if n == 2:
+        return True
+    if n % 2 == 0:
+        return False
+
+    # Check odd divisors up to square root
+    sqrt_n = int(math.sqrt(n)) + 1
+    for i in range(3, sqrt_n, 2):
+        if n % i == 0:
+            return False
+
+    return True
+
+
+def _prod_range(a: int, b: int) -> int:
+    """Product of the integers in [a, b] via a balanced product tree.
+
+    Splitting keeps the two operands of every multiplication near the
+    same bit-length, where CPython's Karatsuba pays off; a linear
+    result *= i loop instead regrows the huge left operand each step.
+    """
+    if b - a < 8:
+        result = a
+        for i in range(a + 1, b + 1):
+            result *= i
+        return result
+    mid = (a + b) // 2
+    return _prod_range(a, mid) * _prod_range(mid + 1, b)
+
+
+@functools.lru_cache(maxsize=None)
+def _factorial(n: int) -> int:
+    """Factorial of n, memoized across calls."""
+    if n < 2:
+        return 1
+    if gmpy2 is not None:
+        return int(gmpy2.fac(n))
+    return _prod_range(2, n)
+
+
+@functools.lru_cache(maxsize=None)
+def _fib_pair(n: int) -> tuple:
+    """(F(n), F(n+1)) by fast doubling: O(log n) multiplications."""
+    if n == 0:
+        return (0, 1)
+    a, b = _fib_pair(n >> 1)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    if n & 1:
+        return (d, c + d)
+    return (c, d)
+
+
+def _fib(n: int) -> int:
+    """n-th Fibonacci number, memoized across calls."""
+    return _fib_pair(n)[0]
+
 
 class ProcessWorker(BaseWorker):
     """Process-based worker for CPU-bound tasks."""
 
-    def __init__(self, name: str = "ProcessWorker"):
+    def __init__(self, name: str = "ProcessWorker", max_workers: int = None,
+                 initializer: Callable = None):
         super().__init__(name)
+        # One long-lived pool per worker instance: children are spawned
+        # once and reused across batches instead of per process_batch
+        # call (workers start lazily on first submit, so an unused
+        # worker costs nothing)
+        self._max_workers = max_workers or multiprocessing.cpu_count()
+        self._initializer = initializer
         self._executor: Optional[ProcessPoolExecutor] = None
 
+    def _get_executor(self, max_workers: int = None) -> ProcessPoolExecutor:
+        """Get the persistent pool, recreating it only when resized."""
+        if max_workers is not None and max_workers != self._max_workers:
+            self.close()
+            self._max_workers = max_workers
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=self._initializer
+            )
+        return self._executor
+
+    def __getstate__(self):
+        """Drop the live pool when the worker is pickled into a child."""
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
+
     def work(self, task: Any) -> Any:
         """Execute work in a separate process."""
         try:
             # For process workers, we typically handle CPU-intensive operations
-            if hasattr(task, '__call__'):
+            # (callable() is a C-level check; hasattr walks getattr and
+            # catches AttributeError on every call)
+            if callable(task):
                 return task()
             else:
                 return task
@@ -27,87 +149,99 @@ class ProcessWorker(BaseWorker):
             raise
 
     def process_batch(self, tasks: List[Any], max_workers: int = None) -> List[Any]:
-        """Process a batch of tasks using process pool."""
-        results = []
-
-        # Use CPU count if max_workers not specified
-        if max_workers is None:
-            max_workers = multiprocessing.cpu_count()
-
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            future_to_task = {
-                executor.submit(self.work, task): task
-                for task in tasks
-            }
-
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    self.logger.debug(f"Completed task: {task}")
-                except Exception as e:
-                    self.logger.error(f"Task failed: {task}, Error: {e}")
-                    results.append(None)
+        """Process a batch of tasks using the persistent process pool.
+
+        Results are returned in input order, with None for failed tasks.
+        """
+        results: List[Any] = [None] * len(tasks)
+
+        # Plain values need no pool round trip at all; only callables
+        # get submitted, pre-partitioned so children skip the dispatch
+        # test entirely
+        callable_indexed = [(i, t) for i, t in enumerate(tasks) if callable(t)]
+        for i, task in enumerate(tasks):
+            if not callable(task):
+                results[i] = task
+
+        if callable_indexed:
+            executor = self._get_executor(max_workers)
+            # map with chunksize ships tasks in pickled batches rather
+            # than one IPC round trip each; _safe_call turns per-task
+            # errors into None so one bad task doesn't abort the batch
+            chunksize = max(1, len(callable_indexed) // (self._max_workers * 4))
+            mapped = executor.map(self._safe_call,
+                                  [t for _, t in callable_indexed],
+                                  chunksize=chunksize)
+            for (i, _), result in zip(callable_indexed, mapped):
+                results[i] = result
+
+        # %-style args are only formatted if DEBUG is actually enabled
+        self.logger.debug("Completed batch of %d tasks", len(tasks))
 
         return results
 
+    def close(self) -> None:
+        """Shut down the persistent pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def __enter__(self):
         """Context manager entry."""
-        self._executor = ProcessPoolExecutor()
+        self._get_executor()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        if self._executor:
-            self._executor.shutdown(wait=True)
+        self.close()
 
 
 class CPUIntensiveWorker(ProcessWorker):
     """Specialized worker for CPU-intensive mathematical operations."""
 
     def __init__(self):
-        super().__init__("CPUIntensiveWorker")
+        super().__init__("CPUIntensiveWorker", initializer=_worker_init)
 
     def calculate_primes_range(self, start: int, end: int) -> List[int]:
         """Calculate prime numbers in a given range."""
-        import math
+        if end < 2:
+            return []
 
-        primes = []
-        for num in range(max(2, start), end + 1):
-            if self._is_prime(num):
-                primes.append(num)
-        return primes
+        # JIT kernel when available: compiled trial division tested in
+        # parallel across candidates, compile-once via cache=True
+        if _kernels is not None:
+            return _kernels.primes_in_range(start, end).tolist()
 
-    def _is_prime(self, n: int) -> bool:
-        """Check if a number is prime using optimized trial division."""
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
+        # Sieve of Eratosthenes with vectorized strided stores: the
+        # marking loop runs in C instead of one _is_prime call per
+        # candidate
+        sieve = np.ones(end + 1, dtype=np.bool_)
+        sieve[:2] = False
+        for i in range(2, math.isqrt(end) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = False
 
-        # Check odd divisors up to square root
-        sqrt_n = int(math.sqrt(n)) + 1
-        for i in range(3, sqrt_n, 2):
-            if n % i == 0:
-                return False
+        lo = max(start, 0)
+        return (np.nonzero(sieve[lo:])[0] + lo).tolist()
 
-        return True
+    def _is_prime(self, n: int) -> bool:
+        """Check if a number is prime (cached at module level)."""
+        return _is_prime(n)
 
     def fibonacci_sequence(self, n: int) -> List[int]:
         """Generate Fibonacci sequence up to n terms."""
         if n <= 0:
             return []
-        elif n == 1:
-            return [0]
-        elif n == 2:
-            return [0, 1]
 
-        sequence = [0, 1]
-        for i in range(2, n):
-            sequence.append(sequence[i - 1] + sequence[i - 2])
+        # Pre-sized list plus a two-variable rolling update: no growth
+        # reallocations and no pair of list lookups per term
+        sequence = [0] * n
+        if n > 1:
+            sequence[1] = 1
+            a, b = 0, 1
+            for i in range(2, n):
+                a, b = b, a + b
+                sequence[i] = b
 
         return sequence
 
@@ -115,11 +249,4 @@ class CPUIntensiveWorker(ProcessWorker):
         """Calculate factorial of n."""
         if n < 0:
             raise ValueError("Factorial is not defined for negative numbers")
-        if n == 0 or n == 1:
-            return 1
-
-        result = 1
-        for i in range(2, n + 1):
-            result *= i
-
-        return result
+        return _factorial(n)